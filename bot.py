@@ -1,13 +1,27 @@
 import os
+import re
+import shutil
+import hashlib
 from telegram import Update, InputFile, InlineKeyboardButton, InlineKeyboardMarkup, CallbackQuery
 from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ContextTypes
+from telegram.error import BadRequest
 import sqlite3
 from datetime import datetime, timedelta
 from config import BOT_TOKEN  # BOT_TOKEN хранится в отдельном файле config.py
 from sqlite3 import adapt, register_adapter
 
 # --- Конфигурация БД ---
+# Общая БД: пользователи, их статусы и подписки на колоды
 DB_PATH = "flashcards.db"
+# Папка с колодами (собирается main.py); у каждой колоды своя БД с карточками и прогрессом
+DECKS_DIR = "decks"
+DECK_DB_NAME = "flashcards.db"
+DECK_IMAGES_DIR = "output_images"
+# Колода и папка изображений, куда переносятся данные из версии без колод
+LEGACY_DECK = "Calc_S3_Exam"
+LEGACY_IMAGES_DIR = "output_images"
+# Колоды, загруженные при запуске бота (заполняется в main)
+DECKS: list[str] = []
 
 # Регистрация адаптера для работы с datetime
 register_adapter(datetime, lambda val: val.isoformat())
@@ -34,14 +48,133 @@ def init_db():
         id INTEGER PRIMARY KEY,
         username TEXT,
         last_review DATETIME,
-        status TEXT DEFAULT 'idle'
+        status TEXT DEFAULT 'idle',
+        current_deck TEXT
     )''')
 
-    # Проверяем, есть ли столбец `status` в таблице `users`, и добавляем его, если его нет
+    # Проверяем, есть ли столбцы `status` и `current_deck` в таблице `users`, и добавляем их, если их нет
     cursor.execute("PRAGMA table_info(users)")
     columns = [col[1] for col in cursor.fetchall()]
     if "status" not in columns:
         cursor.execute("ALTER TABLE users ADD COLUMN status TEXT DEFAULT 'idle'")
+    if "current_deck" not in columns:
+        cursor.execute("ALTER TABLE users ADD COLUMN current_deck TEXT")
+
+    # Таблица подписок пользователей на колоды
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS user_decks (
+        user_id INTEGER,
+        deck TEXT,
+        PRIMARY KEY (user_id, deck),
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+    )''')
+
+    conn.commit()
+    conn.close()
+
+
+def migrate_legacy_db():
+    """
+    Однократно переносит карточки и прогресс из общей БД (версия без колод) в колоду LEGACY_DECK.
+    Папка output_images переносится в папку колоды, пути к изображениям переписываются,
+    а старые таблицы удаляются из общей БД.
+    """
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'flashcards'")
+    if cursor.fetchone() is None:
+        conn.close()
+        return
+
+    deck_directory = os.path.join(DECKS_DIR, LEGACY_DECK)
+    images_directory = os.path.join(deck_directory, DECK_IMAGES_DIR)
+    os.makedirs(deck_directory, exist_ok=True)
+    if os.path.isdir(LEGACY_IMAGES_DIR) and not os.path.exists(images_directory):
+        shutil.move(LEGACY_IMAGES_DIR, images_directory)
+
+    init_deck_db(LEGACY_DECK)
+    deck_conn = connect_deck(LEGACY_DECK)
+    deck_cursor = deck_conn.cursor()
+
+    # Карточки сопоставляются по имени файла: id в колоде могут не совпадать со старыми
+    cursor.execute('''SELECT id, image_path FROM flashcards''')
+    card_ids = {}
+    for legacy_id, legacy_path in cursor.fetchall():
+        image_path = os.path.join(images_directory, re.split(r"[\\/]", legacy_path)[-1])
+        deck_cursor.execute('''INSERT OR IGNORE INTO flashcards (image_path) VALUES (?)''', (image_path,))
+        deck_cursor.execute('''SELECT id FROM flashcards WHERE image_path = ?''', (image_path,))
+        card_ids[legacy_id] = deck_cursor.fetchone()[0]
+
+    cursor.execute('''SELECT user_id, card_id, confidence, review_date FROM user_flashcards''')
+    for user_id, legacy_id, confidence, review_date in cursor.fetchall():
+        if legacy_id in card_ids:
+            deck_cursor.execute('''INSERT OR IGNORE INTO user_flashcards (user_id, card_id, confidence, review_date)
+                                   VALUES (?, ?, ?, ?)''', (user_id, card_ids[legacy_id], confidence, review_date))
+
+    deck_conn.commit()
+    deck_conn.close()
+
+    # Все существующие пользователи занимались единственной колодой
+    cursor.execute('''INSERT OR IGNORE INTO user_decks (user_id, deck) SELECT id, ? FROM users''', (LEGACY_DECK,))
+    cursor.execute('''UPDATE users SET current_deck = ? WHERE current_deck IS NULL''', (LEGACY_DECK,))
+
+    cursor.execute('''DROP TABLE user_flashcards''')
+    cursor.execute('''DROP TABLE flashcards''')
+
+    conn.commit()
+    conn.close()
+    print(f"Данные перенесены в колоду {LEGACY_DECK}.")
+
+
+def load_decks() -> list[str]:
+    """
+    Находит колоды, собранные main.py в папке DECKS_DIR, и готовит их базы данных.
+    Колоды, собранные после запуска бота, станут доступны после перезапуска.
+    """
+    if not os.path.isdir(DECKS_DIR):
+        return []
+
+    decks = sorted(
+        deck for deck in os.listdir(DECKS_DIR)
+        if os.path.isdir(os.path.join(DECKS_DIR, deck, DECK_IMAGES_DIR))
+    )
+    for deck in decks:
+        init_deck_db(deck)
+        add_existing_cards_to_db(deck)  # Добавляем карточки из папки колоды в её базу данных
+
+    return decks
+
+
+def get_decks() -> list[str]:
+    """Возвращает список колод, загруженных при запуске бота."""
+    return DECKS
+
+
+def get_deck_key(deck: str) -> str:
+    """
+    Возвращает короткий ключ колоды для callback_data.
+    Telegram ограничивает callback_data 64 байтами, а имя колоды может быть длиннее.
+    """
+    return hashlib.md5(deck.encode("utf-8")).hexdigest()[:8]
+
+
+def get_deck_by_key(key: str):
+    """Возвращает колоду по ключу из get_deck_key (или None, если такой колоды нет)."""
+    return next((deck for deck in get_decks() if get_deck_key(deck) == key), None)
+
+
+def connect_deck(deck: str) -> sqlite3.Connection:
+    """Открывает БД колоды. Карточки и прогресс каждой колоды хранятся в отдельном файле."""
+    return sqlite3.connect(os.path.join(DECKS_DIR, deck, DECK_DB_NAME))
+
+
+def init_deck_db(deck: str):
+    conn = connect_deck(deck)
+    cursor = conn.cursor()
+
+    # Включение поддержки внешних ключей
+    cursor.execute('PRAGMA foreign_keys = ON;')
 
     # Таблица карточек
     cursor.execute('''
@@ -51,6 +184,7 @@ def init_db():
     )''')
 
     # Таблица статусов карточек для пользователей
+    # (пользователи хранятся в общей БД, поэтому внешний ключ только на карточку)
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS user_flashcards (
         user_id INTEGER,
@@ -58,25 +192,29 @@ def init_db():
         confidence INTEGER DEFAULT 0,
         review_date DATETIME,
         PRIMARY KEY (user_id, card_id),
-        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
         FOREIGN KEY (card_id) REFERENCES flashcards(id) ON DELETE CASCADE
     )''')
 
+    # Индекс для выборки карточек на повторение
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_user_flashcards_review
+    ON user_flashcards (user_id, review_date)''')
+
     conn.commit()
     conn.close()
 
 
-def add_existing_cards_to_db():
-    """Добавляет карточки из папки output_images в базу данных, если их там еще нет."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-
-    image_folder = "output_images"
+def add_existing_cards_to_db(deck: str):
+    """Добавляет карточки из папки output_images колоды в её базу данных, если их там еще нет."""
+    image_folder = os.path.join(DECKS_DIR, deck, DECK_IMAGES_DIR)
     if not os.path.exists(image_folder):
         print(f"Папка {image_folder} не найдена.")
         return
 
-    for image_file in os.listdir(image_folder):
+    conn = connect_deck(deck)
+    cursor = conn.cursor()
+
+    for image_file in sorted(os.listdir(image_folder)):
         image_path = os.path.join(image_folder, image_file)
 
         if os.path.isfile(image_path):
@@ -133,10 +271,75 @@ def set_user_status(user_id, status):
     conn.close()
 
 
-def get_due_flashcards(user_id: int):
+def get_user_deck(user_id: int):
+    """Возвращает текущую колоду пользователя (или None, если колода не выбрана)."""
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
 
+    cursor.execute('''SELECT current_deck FROM users WHERE id = ?''', (user_id,))
+    result = cursor.fetchone()
+    conn.close()
+
+    deck = result[0] if result else None
+    if deck in get_decks():
+        return deck
+
+    # Если текущая колода не выбрана, используем первую колоду из подписок
+    subscriptions = [deck for deck in get_user_subscriptions(user_id) if deck in get_decks()]
+    return subscriptions[0] if subscriptions else None
+
+
+def set_user_deck(user_id: int, deck: str):
+    """Делает колоду текущей для пользователя и подписывает его на неё."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute('''UPDATE users SET current_deck = ? WHERE id = ?''', (deck, user_id))
+    cursor.execute('''INSERT OR IGNORE INTO user_decks (user_id, deck) VALUES (?, ?)''', (user_id, deck))
+
+    conn.commit()
+    conn.close()
+
+
+def get_user_subscriptions(user_id: int) -> list[str]:
+    """Возвращает список колод, на которые подписан пользователь."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute('''SELECT deck FROM user_decks WHERE user_id = ? ORDER BY deck''', (user_id,))
+    decks = [row[0] for row in cursor.fetchall()]
+    conn.close()
+
+    return decks
+
+
+def subscribe_user_to_deck(user_id: int, deck: str):
+    """Подписывает пользователя на колоду, не меняя текущую колоду."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute('''INSERT OR IGNORE INTO user_decks (user_id, deck) VALUES (?, ?)''', (user_id, deck))
+
+    conn.commit()
+    conn.close()
+
+
+def unsubscribe_user_from_deck(user_id: int, deck: str):
+    """Отписывает пользователя от колоды. Прогресс в колоде сохраняется."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute('''DELETE FROM user_decks WHERE user_id = ? AND deck = ?''', (user_id, deck))
+    cursor.execute('''UPDATE users SET current_deck = NULL WHERE id = ? AND current_deck = ?''', (user_id, deck))
+
+    conn.commit()
+    conn.close()
+
+
+def get_due_flashcards(deck: str, user_id: int):
+    conn = connect_deck(deck)
+    cursor = conn.cursor()
+
     cursor.execute('''SELECT uf.card_id, f.image_path FROM user_flashcards uf
                       JOIN flashcards f ON uf.card_id = f.id
                       WHERE uf.user_id = ? AND uf.review_date <= ?''', (user_id, datetime.now()))
@@ -147,8 +350,8 @@ def get_due_flashcards(user_id: int):
     return flashcards
 
 
-def get_new_flashcards(user_id: int):
-    conn = sqlite3.connect(DB_PATH)
+def get_new_flashcards(deck: str, user_id: int):
+    conn = connect_deck(deck)
     cursor = conn.cursor()
 
     cursor.execute('''SELECT id, image_path FROM flashcards
@@ -160,8 +363,8 @@ def get_new_flashcards(user_id: int):
     return flashcards
 
 
-def assign_card_to_user(card_id: int, user_id: int):
-    conn = sqlite3.connect(DB_PATH)
+def assign_card_to_user(deck: str, card_id: int, user_id: int):
+    conn = connect_deck(deck)
     cursor = conn.cursor()
 
     cursor.execute('''INSERT OR IGNORE INTO user_flashcards (user_id, card_id, review_date) VALUES (?, ?, ?)''',
@@ -171,8 +374,8 @@ def assign_card_to_user(card_id: int, user_id: int):
     conn.close()
 
 
-def update_flashcard_review(user_id: int, card_id: int, success: bool):
-    conn = sqlite3.connect(DB_PATH)
+def update_flashcard_review(deck: str, user_id: int, card_id: int, success: bool):
+    conn = connect_deck(deck)
     cursor = conn.cursor()
 
     cursor.execute('''SELECT confidence FROM user_flashcards WHERE user_id = ? AND card_id = ?''', (user_id, card_id))
@@ -225,6 +428,7 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     sent_message = await update.effective_message.reply_text(
         "Привет! Добро пожаловать в бота для изучения карточек с использованием методики интервального повторения.\n\n"
         "📋 **Доступные команды:**\n"
+        "/decks - выбрать колоду и управлять подписками\n"
         "/learn - учить новые карточки\n"
         "/review - повторять карточки\n"
         "/statistic - посмотреть вашу статистику\n"
@@ -270,10 +474,15 @@ async def learn(update: Update | CallbackQuery, context: ContextTypes.DEFAULT_TY
         if not await check_user_status(user_id, message):
             return
 
+    deck = get_user_deck(user_id)
+    if not deck:
+        await message.reply_text("Сначала выберите колоду с помощью /decks.")
+        return
+
     # Установить статус "learning"
     set_user_status(user_id, "learning")
 
-    flashcards = get_new_flashcards(user_id)
+    flashcards = get_new_flashcards(deck, user_id)
 
     if not flashcards:
         message = update.message if update.message else update.callback_query.message
@@ -283,7 +492,8 @@ async def learn(update: Update | CallbackQuery, context: ContextTypes.DEFAULT_TY
     # Отправляем первую новую карточку
     card_id, image_path = flashcards[0]
     context.user_data['current_card'] = card_id
-    assign_card_to_user(card_id, user_id)
+    context.user_data['current_deck'] = deck
+    assign_card_to_user(deck, card_id, user_id)
 
     keyboard = [
         [InlineKeyboardButton("Посмотреть изображение", callback_data="view_image")],
@@ -313,10 +523,15 @@ async def review(update: Update | CallbackQuery, context: ContextTypes.DEFAULT_T
         if not await check_user_status(user_id, message):
             return
 
+    deck = get_user_deck(user_id)
+    if not deck:
+        await message.reply_text("Сначала выберите колоду с помощью /decks.")
+        return
+
     # Установить статус "reviewing"
     set_user_status(user_id, "reviewing")
 
-    flashcards = get_due_flashcards(user_id)
+    flashcards = get_due_flashcards(deck, user_id)
 
     if not flashcards:
         message = update.message if update.message else update.callback_query.message
@@ -326,6 +541,7 @@ async def review(update: Update | CallbackQuery, context: ContextTypes.DEFAULT_T
     # Отправляем первую карточку
     card_id, image_path = flashcards[0]
     context.user_data['current_card'] = card_id
+    context.user_data['current_deck'] = deck
 
     keyboard = [
         [InlineKeyboardButton("Посмотреть изображение", callback_data="view_image")],
@@ -347,9 +563,13 @@ async def show_next_card(query, user_id, context):
     """Определяет текущий статус пользователя и показывает следующую карточку."""
     # Проверяем статус пользователя (учим новые или повторяем)
     current_status = get_user_status(user_id)
+    deck = get_user_deck(user_id)
 
-    if current_status == "learning":
-        flashcards = get_new_flashcards(user_id)
+    if not deck:
+        set_user_status(user_id, "idle")
+        await query.message.reply_text("Сначала выберите колоду с помощью /decks.")
+    elif current_status == "learning":
+        flashcards = get_new_flashcards(deck, user_id)
         if flashcards:
             await learn(query, context)
         else:
@@ -358,7 +578,7 @@ async def show_next_card(query, user_id, context):
             await query.message.reply_text(
                 "Вы завершили обучение новых карточек. Переходим к повторению."
             )
-            flashcards = get_due_flashcards(user_id)
+            flashcards = get_due_flashcards(deck, user_id)
             if flashcards:
                 await review(query, context)
             else:
@@ -368,7 +588,7 @@ async def show_next_card(query, user_id, context):
                     "На данный момент карточек для обучения и повторения больше нет. Хорошая работа!"
                 )
     elif current_status == "reviewing":
-        flashcards = get_due_flashcards(user_id)
+        flashcards = get_due_flashcards(deck, user_id)
         if flashcards:
             await review(query, context)
         else:
@@ -377,7 +597,7 @@ async def show_next_card(query, user_id, context):
             await query.message.reply_text(
                 "Вы завершили повторение карточек. Переходим к обучению новых."
             )
-            flashcards = get_new_flashcards(user_id)
+            flashcards = get_new_flashcards(deck, user_id)
             if flashcards:
                 await learn(query, context)
             else:
@@ -393,18 +613,102 @@ async def show_next_card(query, user_id, context):
         )
 
 
+def build_decks_keyboard(user_id: int) -> InlineKeyboardMarkup:
+    """Строит клавиатуру со списком колод: выбор колоды и подписка на неё. Колоды из подписок идут первыми."""
+    current_deck = get_user_deck(user_id)
+    subscriptions = get_user_subscriptions(user_id)
+
+    keyboard = []
+    for deck in sorted(get_decks(), key=lambda deck: deck not in subscriptions):
+        deck_key = get_deck_key(deck)
+        title = f"✅ {deck}" if deck == current_deck else deck
+        row = [InlineKeyboardButton(title, callback_data=f"deck:{deck_key}")]
+        if deck in subscriptions:
+            row.append(InlineKeyboardButton("Отписаться", callback_data=f"unsub:{deck_key}"))
+        else:
+            row.append(InlineKeyboardButton("Подписаться", callback_data=f"sub:{deck_key}"))
+        keyboard.append(row)
+
+    return InlineKeyboardMarkup(keyboard)
+
+
+async def decks(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    user = update.effective_user
+    add_user_to_db(user.id, user.username)
+
+    if not get_decks():
+        await update.message.reply_text("Колоды пока не собраны. Запустите main.py с архивами билетов.")
+        return
+
+    subscriptions = get_user_subscriptions(user.id)
+    subscriptions_text = ", ".join(subscriptions) if subscriptions else "нет"
+
+    response = await update.message.reply_text(
+        "📚 Выберите колоду для /learn и /review.\n"
+        "Колоды из подписок показываются первыми; если колода не выбрана, используется первая из них.\n\n"
+        f"Ваши подписки: {subscriptions_text}",
+        reply_markup=build_decks_keyboard(user.id)
+    )
+
+    # Сохраняем ID сообщения в контекст
+    if "bot_messages" not in context.user_data:
+        context.user_data["bot_messages"] = []
+    context.user_data["bot_messages"].append(response.message_id)
+
+
+async def deck_button_handler(query: CallbackQuery, user_id: int, context: ContextTypes.DEFAULT_TYPE):
+    """Обрабатывает выбор колоды, подписку и отписку."""
+    action, deck_key = query.data.split(":", 1)
+    deck = get_deck_by_key(deck_key)
+
+    if not deck:
+        await query.message.reply_text("Такой колоды больше нет. Обновите список: /decks")
+        return
+
+    previous_deck = get_user_deck(user_id)
+
+    if action == "deck":
+        set_user_deck(user_id, deck)
+        await query.message.reply_text(f"Текущая колода: {deck}. Начните с /learn или /review.")
+    elif action == "sub":
+        subscribe_user_to_deck(user_id, deck)
+        await query.message.reply_text(f"Вы подписались на колоду {deck}.")
+    else:
+        unsubscribe_user_from_deck(user_id, deck)
+        await query.message.reply_text(f"Вы отписались от колоды {deck}.")
+
+    # Если текущая колода сменилась, карточка из прежней колоды больше не актуальна
+    if get_user_deck(user_id) != previous_deck:
+        set_user_status(user_id, "idle")
+        context.user_data.pop('current_card', None)
+        context.user_data.pop('current_deck', None)
+
+    try:
+        await query.message.edit_reply_markup(reply_markup=build_decks_keyboard(user_id))
+    except BadRequest as e:
+        # Клавиатура не изменилась (например, повторный выбор текущей колоды)
+        print(f"Не удалось обновить список колод: {e}")
+
+
 async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     await query.answer()
 
     user_id = query.from_user.id
+
+    # Кнопки выбора колоды не зависят от текущей карточки
+    if query.data.startswith(("deck:", "sub:", "unsub:")):
+        await deck_button_handler(query, user_id, context)
+        return
+
     card_id = context.user_data.get('current_card')
+    deck = context.user_data.get('current_deck')
 
-    if not card_id:
+    if not card_id or not deck:
         await query.message.reply_text("Сначала начните с /review или /learn.")
         return
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = connect_deck(deck)
     cursor = conn.cursor()
 
     cursor.execute('''SELECT image_path FROM flashcards WHERE id = ?''', (card_id,))
@@ -422,12 +726,12 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
     elif query.data == "know":
-        update_flashcard_review(user_id, card_id, True)
+        update_flashcard_review(deck, user_id, card_id, True)
         await query.message.edit_reply_markup(reply_markup=None)
         await show_next_card(query, user_id, context)
 
     elif query.data == "dont_know":
-        update_flashcard_review(user_id, card_id, False)
+        update_flashcard_review(deck, user_id, card_id, False)
         await query.message.edit_reply_markup(reply_markup=None)
         await show_next_card(query, user_id, context)
 
@@ -448,6 +752,7 @@ async def about(update: Update, context: ContextTypes.DEFAULT_TYPE):
         f"{intervals_text}\n\n"
         "Карточки, которые вы знаете лучше, будут показываться реже, а те, которые сложнее, — чаще.\n\n"
         "Для начала работы используйте команды:\n"
+        "/decks - выбрать колоду\n"
         "/learn - учить новые карточки\n"
         "/review - повторять карточки\n"
         "/statistic - посмотреть вашу статистику\n"
@@ -478,7 +783,12 @@ def format_timedelta(delta: timedelta) -> str:
 async def statistic(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = update.effective_user.id
 
-    conn = sqlite3.connect(DB_PATH)
+    deck = get_user_deck(user_id)
+    if not deck:
+        await update.message.reply_text("Сначала выберите колоду с помощью /decks.")
+        return
+
+    conn = connect_deck(deck)
     cursor = conn.cursor()
 
     # Подсчет общего количества карточек
@@ -501,7 +811,7 @@ async def statistic(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if total_cards == 0:
         stats_message = "У вас пока нет карточек. Начните с /learn, чтобы добавить новые!"
     else:
-        stats_message = f"📊 Ваша статистика:\n\n"
+        stats_message = f"📊 Ваша статистика по колоде {deck}:\n\n"
         stats_message += f"Общее количество карточек: {total_cards}\n\n"
         stats_message += "Уровень уверенности:\n"
 
@@ -520,7 +830,8 @@ async def statistic(update: Update, context: ContextTypes.DEFAULT_TYPE):
 # --- Запуск бота ---
 def main():
     init_db()
-    add_existing_cards_to_db()  # Добавляем карточки из папки в базу данных
+    migrate_legacy_db()  # Переносим данные из версии без колод, если они есть
+    DECKS[:] = load_decks()
 
     application = Application.builder().token(BOT_TOKEN).build()
 
@@ -529,6 +840,7 @@ def main():
     application.add_handler(CommandHandler("review", review))
     application.add_handler(CommandHandler("about", about))
     application.add_handler(CommandHandler("statistic", statistic))
+    application.add_handler(CommandHandler("decks", decks))
     application.add_handler(CallbackQueryHandler(button_handler))
 
     application.run_polling()
@@ -3,6 +3,7 @@ import zipfile
 import re
 import shutil
 import subprocess
+import sys
 
 def sanitize_filename(filename):
     sanitized = re.sub(r'[^a-zA-Zа-яА-Я0-9]', '_', filename)
@@ -98,23 +99,70 @@ def remove_comments_from_file(file_path):
         file.write(content_without_comments)
     print(f"Комментарии успешно удалены из файла: {file_path}")
 
-# Пример использования
-archive_path = "Calc_S3_Exam.zip"
-extract_to = "extracted_content"
-output_directory = "output_sections"
-images_directory = "output_images"
-added_text_path = "added.txt"
+def get_deck_name(archive_path):
+    """Возвращает имя колоды по имени архива (может быть пустым для имён вроде ___.zip)."""
+    return sanitize_filename(os.path.splitext(os.path.basename(archive_path))[0])
+
+def check_deck_names(archive_paths):
+    """
+    Проверяет, что у каждого архива непустое и уникальное имя колоды.
+
+    :param archive_paths: Пути к zip-архивам
+    :return: Список сообщений об ошибках (пустой, если всё в порядке)
+    """
+    errors = []
+    archives_by_deck = {}
+    for archive_path in archive_paths:
+        deck_name = get_deck_name(archive_path)
+        if not deck_name:
+            errors.append(f"Не удалось получить имя колоды из имени архива {archive_path}.")
+        elif deck_name in archives_by_deck:
+            errors.append(f"Архивы {archives_by_deck[deck_name]} и {archive_path} дают одно имя колоды {deck_name}.")
+        else:
+            archives_by_deck[deck_name] = archive_path
+    return errors
 
-typst_file = extract_archive(archive_path, extract_to)
+def build_deck(archive_path, decks_directory, added_text_path):
+    """
+    Собирает колоду из архива: распаковывает его и генерирует изображения билетов.
+    Каждая колода получает собственную папку decks_directory/<имя_колоды>.
 
-if typst_file:
-    # Удаляем комментарии из файла main.typ
-    remove_comments_from_file(typst_file)
+    :param archive_path: Путь к zip-архиву с main.typ
+    :param decks_directory: Папка, в которой хранятся все колоды
+    :param added_text_path: Путь к файлу с общим заголовком typst
+    """
+    deck_name = get_deck_name(archive_path)
+    deck_directory = os.path.join(decks_directory, deck_name)
+
+    extract_to = os.path.join(deck_directory, "extracted_content")
+    output_directory = os.path.join(deck_directory, "output_sections")
+    images_directory = os.path.join(deck_directory, "output_images")
+
+    typst_file = extract_archive(archive_path, extract_to)
+
+    if typst_file:
+        # Удаляем комментарии из файла main.typ
+        remove_comments_from_file(typst_file)
+
+        # Копируем файлы из extracted_content в output_sections
+        copy_files_to_output_directory(extract_to, output_directory)
+
+        # Разделяем файл .typst и генерируем изображения
+        split_typst_file(typst_file, output_directory, images_directory, added_text_path, extract_to)
+        print(f"Колода {deck_name} собрана в {deck_directory}")
+    else:
+        print(f"Файл main.typ не найден в архиве {archive_path}.")
+
+# Пример использования: python main.py Calc_S3_Exam.zip Other_Course.zip
+archive_paths = sys.argv[1:] or ["Calc_S3_Exam.zip"]
+decks_directory = "decks"
+added_text_path = "added.txt"
 
-    # Копируем файлы из extracted_content в output_sections
-    copy_files_to_output_directory(extract_to, output_directory)
+# Проверяем имена колод до сборки, чтобы архивы не перезаписали друг друга
+deck_name_errors = check_deck_names(archive_paths)
+if deck_name_errors:
+    print("\n".join(deck_name_errors))
+    sys.exit(1)
 
-    # Разделяем файл .typst и генерируем изображения
-    split_typst_file(typst_file, output_directory, images_directory, added_text_path, extract_to)
-else:
-    print("Файл main.typ не найден в архиве.")
+for archive_path in archive_paths:
+    build_deck(archive_path, decks_directory, added_text_path)